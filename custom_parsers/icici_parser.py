@@ -31,17 +31,10 @@ def parse(pdf_path: str) -> pd.DataFrame:
     # Read and return the CSV data
     df = pd.read_csv(csv_file)
     
-    # Ensure proper data types and formatting
-    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y').dt.strftime('%d-%m-%Y')
-    
-    # Convert numeric columns properly
-    df['Debit Amt'] = pd.to_numeric(df['Debit Amt'], errors='coerce')
-    df['Credit Amt'] = pd.to_numeric(df['Credit Amt'], errors='coerce')
-    df['Balance'] = pd.to_numeric(df['Balance'], errors='coerce')
-    
-    # Replace NaN with empty string for consistency
-    df['Debit Amt'] = df['Debit Amt'].fillna('')
-    df['Credit Amt'] = df['Credit Amt'].fillna('')
+    # Dates are already DD-MM-YYYY; convert amount columns in one pass and
+    # keep them numeric (NaN for blanks)
+    amount_cols = ['Debit Amt', 'Credit Amt', 'Balance']
+    df[amount_cols] = df[amount_cols].apply(pd.to_numeric, errors='coerce')
     
     return df
 
@@ -4,32 +4,39 @@ PDF Parsing Demonstration
 Shows how the agent parses actual PDF content and saves results
 """
 
+import shlex
 import subprocess
 import sys
 import time
+from collections import deque
 from pathlib import Path
 
 def run_command(cmd, description):
-    """Run a command and display the result"""
+    """Run a command, streaming its output as it arrives"""
     print(f"\n🔄 {description}")
     print(f"Command: {cmd}")
     print("-" * 50)
     
-    start_time = time.time()
+    start = time.perf_counter_ns()
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        end_time = time.time()
+        # stderr is merged into stdout so a single pipe is drained and the
+        # child can never block on a full stderr buffer
+        proc = subprocess.Popen(shlex.split(cmd), stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, bufsize=1)
+        tail = deque(maxlen=200)  # last lines, repeated if the command fails
+        for line in proc.stdout:
+            print(line, end="")
+            tail.append(line)
+        proc.wait()
+        dt_s = (time.perf_counter_ns() - start) / 1e9
         
-        if result.returncode == 0:
-            print(f"✅ Success ({end_time - start_time:.2f}s)")
-            if result.stdout:
-                print("Output:")
-                print(result.stdout)
+        if proc.returncode == 0:
+            print(f"✅ Success ({dt_s:.3f}s)")
         else:
-            print(f"❌ Failed ({end_time - start_time:.2f}s)")
-            if result.stderr:
+            print(f"❌ Failed ({dt_s:.3f}s)")
+            if tail:
                 print("Error:")
-                print(result.stderr)
+                print("".join(tail), end="")
             return False
     except Exception as e:
         print(f"❌ Exception: {e}")
@@ -85,7 +92,7 @@ def main():
     print("🧪 TESTING GENERATED PARSER")
     print("="*60)
     
-    if not run_command('python custom_parsers\\sbi_parser.py "data/sbi/SBI_Test_Data.pdf"', "Testing SBI parser directly"):
+    if not run_command('python custom_parsers/sbi_parser.py "data/sbi/SBI_Test_Data.pdf"', "Testing SBI parser directly"):
         print("❌ Parser test failed")
         return False
     
@@ -4,47 +4,112 @@ Generalization Test: Demonstrates agent working with different banks
 Shows how the agent adapts to new bank formats without manual tweaks
 """
 
+import functools
+import os
+import re
+import shlex
 import subprocess
 import sys
+import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-def run_command(cmd, description):
-    """Run a command and display the result"""
-    print(f"\n🔄 {description}")
-    print(f"Command: {cmd}")
-    print("-" * 50)
-    
-    start_time = time.time()
+PARSERS_DIR = "custom_parsers"
+PARSER_FILE_RE = re.compile(r"_parser\.py$")
+# Commands are argv lists run without a shell, on the current interpreter
+ICICI_CMD = [sys.executable, "agent.py", "--target", "icici"]
+SBI_CMD = [sys.executable, "agent.py", "--target", "sbi"]
+
+# (bank, section title, sample PDF, agent command)
+BANKS = (
+    ("icici", "ICICI BANK (Original)", "data/icici/icici sample.pdf", ICICI_CMD),
+    ("sbi", "SBI BANK (New Bank)", "data/sbi/SBI_Test_Data.pdf", SBI_CMD),
+)
+
+# Serializes output lines from commands running on different threads
+_OUTPUT_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def get_parsers():
+    """File names of the generated parsers in PARSERS_DIR, listed once per process"""
+    # Directory entries carry their file type, so filtering out __pycache__
+    # and other directories needs no per-entry stat()
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        end_time = time.time()
-        
-        if result.returncode == 0:
-            print(f"✅ Success ({end_time - start_time:.2f}s)")
-            if result.stdout:
-                print("Output:")
-                print(result.stdout)
-        else:
-            print(f"❌ Failed ({end_time - start_time:.2f}s)")
-            if result.stderr:
-                print("Error:")
-                print(result.stderr)
-            return False
+        with os.scandir(PARSERS_DIR) as entries:
+            return tuple(entry.name for entry in entries
+                         if entry.is_file() and PARSER_FILE_RE.search(entry.name))
+    except FileNotFoundError:
+        return ()
+
+def run_command(cmd, prefix=""):
+    """Run a command and return (ok, stdout, stderr, seconds)
+
+    stdout is echoed line by line as the command produces it, each line
+    prefixed so concurrent runs stay readable, and a copy is returned.
+    stderr is collected for reporting failures.
+    """
+    start = time.perf_counter_ns()
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, bufsize=1)
     except Exception as e:
-        print(f"❌ Exception: {e}")
-        return False
+        return False, None, f"Exception: {e}", (time.perf_counter_ns() - start) / 1e9
     
-    return True
-
-def test_bank_parser(bank_name, pdf_path):
-    """Test a specific bank parser"""
-    print(f"\n📊 Testing {bank_name.upper()} Parser")
-    print("=" * 60)
+    # stderr is drained on its own thread so neither pipe can fill up and
+    # block the child
+    stderr_lines = []
+    stderr_reader = threading.Thread(target=stderr_lines.extend, args=(proc.stderr,))
+    stderr_reader.start()
+    
+    stdout_lines = []
+    for line in proc.stdout:
+        stdout_lines.append(line)
+        with _OUTPUT_LOCK:
+            sys.stdout.write(prefix + line)
+            sys.stdout.flush()
+    proc.wait()
+    stderr_reader.join()
     
-    # Test the generated parser
-    cmd = f'python custom_parsers\\{bank_name}_parser.py "{pdf_path}"'
-    return run_command(cmd, f"Running {bank_name} parser")
+    dt_s = (time.perf_counter_ns() - start) / 1e9
+    return proc.returncode == 0, "".join(stdout_lines), "".join(stderr_lines), dt_s
+
+def print_command(cmd, description):
+    """Display the header for a command being reported"""
+    print(f"\n🔄 {description}")
+    print(f"Command: {shlex.join(cmd)}")
+    print("-" * 50)
+
+def show_result(result):
+    """Display the result of a run_command() call
+
+    The command's output was already streamed while it ran, so only the
+    outcome and, on failure, its stderr are shown.
+    """
+    ok, stdout, stderr, dt_s = result
+    if ok:
+        print(f"✅ Success ({dt_s:.3f}s)")
+    else:
+        print(f"❌ Failed ({dt_s:.3f}s)")
+        if stderr:
+            print("Error:")
+            print(stderr)
+    return ok
+
+def parser_command(bank_name, pdf_path):
+    """Argv that runs a generated bank parser"""
+    return [sys.executable, f"custom_parsers/{bank_name}_parser.py", pdf_path]
+
+def run_bank(bank, agent_cmd, parser_cmd):
+    """Generate a bank's parser, then run it if generation succeeded
+
+    Returns the run_command() results for both steps, with None for a parser
+    run that was skipped.
+    """
+    prefix = f"[{bank}] "
+    agent_result = run_command(agent_cmd, prefix)
+    if not agent_result[0]:
+        return agent_result, None
+    return agent_result, run_command(parser_cmd, prefix)
 
 def main():
     """Run the generalization demonstration"""
@@ -53,43 +118,53 @@ def main():
     print("This demonstrates how the agent works with different banks")
     print("without any manual tweaks or code changes!")
     
-    # Test ICICI (original bank)
+    # The banks share no files, so each one runs as its own agent -> parser
+    # pipeline. A bank's parser starts as soon as its own agent finishes,
+    # overlapping whatever the other bank is still doing. Output streams as
+    # it arrives, prefixed with the bank; results are reported in bank order
+    # once both pipelines finish.
     print("\n" + "="*60)
-    print("🏦 TESTING ICICI BANK (Original)")
+    print("🏦 RUNNING " + " AND ".join(bank.upper() for bank, *_ in BANKS))
     print("="*60)
     
-    if not run_command("python agent.py --target icici", "Generating ICICI parser"):
-        print("❌ ICICI test failed")
-        return False
-    
-    if not test_bank_parser("icici", "data/icici/icici sample.pdf"):
-        print("❌ ICICI parser test failed")
-        return False
+    parser_cmds = [parser_command(bank, pdf_path) for bank, _, pdf_path, _ in BANKS]
+    with ThreadPoolExecutor(max_workers=len(BANKS)) as executor:
+        runs = [executor.submit(run_bank, bank, agent_cmd, parser_cmd)
+                for (bank, _, _, agent_cmd), parser_cmd in zip(BANKS, parser_cmds)]
+        results = [run.result() for run in runs]
     
-    # Test SBI (new bank)
     print("\n" + "="*60)
-    print("🏦 TESTING SBI BANK (New Bank)")
+    print("🏦 GENERATING PARSERS")
     print("="*60)
     
-    if not run_command("python agent.py --target sbi", "Generating SBI parser"):
-        print("❌ SBI test failed")
+    generated = []
+    for (bank, _, _, cmd), (agent_result, _) in zip(BANKS, results):
+        print_command(cmd, f"Generating {bank.upper()} parser")
+        generated.append(show_result(agent_result))
+    if not all(generated):
+        print("❌ Parser generation failed")
         return False
     
-    if not test_bank_parser("sbi", "data/sbi/SBI_Test_Data.pdf"):
-        print("❌ SBI parser test failed")
-        return False
+    for (bank, title, _, _), cmd, (_, parser_result) in zip(BANKS, parser_cmds, results):
+        print("\n" + "="*60)
+        print(f"🏦 TESTING {title}")
+        print("="*60)
+        
+        print_command(cmd, f"Running {bank} parser")
+        if not show_result(parser_result):
+            print(f"❌ {bank.upper()} parser test failed")
+            return False
     
     # Show generated parsers
     print("\n" + "="*60)
     print("📁 GENERATED PARSERS")
     print("="*60)
     
-    parsers_dir = Path("custom_parsers")
-    if parsers_dir.exists():
-        parser_files = list(parsers_dir.glob("*_parser.py"))
+    parser_files = get_parsers()
+    if parser_files:
         print(f"Found {len(parser_files)} generated parsers:")
         for parser_file in parser_files:
-            print(f"  - {parser_file.name}")
+            print(f"  - {parser_file}")
     
     print("\n🎉 GENERALIZATION TEST COMPLETE!")
     print("✅ Agent successfully worked with multiple banks")
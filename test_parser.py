@@ -3,23 +3,185 @@
 Test script for the generated parser
 """
 
+import hashlib
+import importlib
+import numpy as np
+import os
 import pandas as pd
+import pickle
 import sys
+import time
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import feather
+except ImportError:  # pyarrow is optional; fall back to the pandas reader
+    pacsv = None
+
+if pacsv is not None:
+    # pyarrow infers types differently from pandas (blank columns become
+    # null, ISO dates become date32), so the statement columns are pinned
+    # to the dtypes pd.read_csv gives them
+    EXPECTED_COLUMN_TYPES = {
+        'Date': pa.string(),
+        'Description': pa.string(),
+        'Debit Amt': pa.float64(),
+        'Credit Amt': pa.float64(),
+        'Balance': pa.float64(),
+    }
+
+try:
+    CACHE_DIR = Path.home() / ".cache" / "ai_agent"
+except RuntimeError:  # no resolvable home directory; run without the cache
+    CACHE_DIR = None
+
+# Generated parsers are imported as top-level modules from here
+sys.path.insert(0, str(Path("custom_parsers").resolve()))
+
+def load_parser(name):
+    """Import a generated parser, reloading it if its file has changed since"""
+    mod = importlib.import_module(name)
+    loaded_at = getattr(mod, "__loaded_at__", None)
+    if loaded_at is not None and os.path.getmtime(mod.__file__) > loaded_at:
+        mod = importlib.reload(mod)
+        loaded_at = None
+    if loaded_at is None:
+        mod.__loaded_at__ = time.time()
+    return mod
+
+def load_expected(path):
+    """Read an expected-output CSV through a pickle cache in CACHE_DIR
+
+    There is one entry per CSV, keyed on its resolved path. The entry stores
+    the CSV's mtime alongside the frame, so editing the CSV misses the cache
+    and the entry is overwritten in place rather than piling up. The cache is
+    best-effort: if it can't be written the parsed frame is returned as is.
+    """
+    if CACHE_DIR is None:
+        return pd.read_csv(path)
+    path = Path(path).resolve()
+    mtime_ns = path.stat().st_mtime_ns
+    cache_file = CACHE_DIR / f"{hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest()}.pkl"
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_mtime_ns, df = pickle.load(f)
+        if cached_mtime_ns == mtime_ns:
+            return df
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+            TypeError, ValueError):
+        # Missing, truncated, or written by an incompatible pandas version
+        pass
+    df = pd.read_csv(path)
+    # Write then rename so a concurrent run never loads a partial pickle
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((mtime_ns, df), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return df
+
+def read_expected(path):
+    """Read an expected-output CSV, using pyarrow's reader when available
+
+    With pyarrow the parsed frame is also cached next to the CSV as Feather
+    and reused until the CSV is modified again; without it, load_expected()
+    caches it as a pickle instead.
+    """
+    if pacsv is None:
+        return load_expected(path)
+    path = Path(path)
+    feather_path = path.with_suffix(".feather")
+    try:
+        if feather_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            table = feather.read_table(feather_path)
+            if _matches_pandas_types(table):
+                return table.to_pandas()
+    except FileNotFoundError:
+        pass
+    table = pacsv.read_csv(
+        path, convert_options=pacsv.ConvertOptions(column_types=EXPECTED_COLUMN_TYPES))
+    if not _matches_pandas_types(table):
+        # Other columns pyarrow would type differently; let pandas infer them
+        return pd.read_csv(path)
+    # Plain to_pandas() rather than types_mapper=pd.ArrowDtype: Arrow-backed
+    # float columns reject fillna(''), which the comparison below relies on
+    df = table.to_pandas()
+    # The cache is best-effort: an unwritable data directory must not fail
+    # the test, nor leave a partial file that a later run would try to read
+    try:
+        df.to_feather(feather_path)
+    except OSError:
+        feather_path.unlink(missing_ok=True)
+    return df
+
+def _matches_pandas_types(table):
+    """Whether a table converts to the same dtypes pd.read_csv would infer
+
+    pyarrow types all-blank columns as null (object of None in pandas, not
+    float64 NaN) and parses ISO dates and timestamps (pandas keeps strings).
+    """
+    return not any(pa.types.is_null(field.type) or pa.types.is_temporal(field.type)
+                   for field in table.schema)
+
+def file_digest(path):
+    """BLAKE2b digest of a file, read in 1 MiB chunks"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.digest()
+
 def test_parser():
     """Test the generated ICICI parser"""
     try:
         # Import the generated parser
-        sys.path.insert(0, str(Path("custom_parsers")))
-        import icici_parser
+        icici_parser = load_parser("icici_parser")
         
         # Test the parser
         pdf_path = "data/icici/icici sample.pdf"
         result_df = icici_parser.parse(pdf_path)
         
-        # Load expected result
-        expected_df = pd.read_csv("data/icici/result.csv")
+        expected_path = "data/icici/result.csv"
+        
+        # Load expected result (served from the Feather/pickle cache)
+        expected_df = read_expected(expected_path)
+        
+        # Shape and column checks are cheap, so fail on those before
+        # touching any cell data
+        if result_df.shape != expected_df.shape:
+            print("FAIL: Parser test FAILED - output doesn't match expected CSV")
+            print(f"Expected shape: {expected_df.shape}, Got shape: {result_df.shape}")
+            return False
+        if list(result_df.columns) != list(expected_df.columns):
+            print("FAIL: Parser test FAILED - output doesn't match expected CSV")
+            print(f"Expected columns: {list(expected_df.columns)}, Got columns: {list(result_df.columns)}")
+            return False
+        
+        # Neither the digest nor the string comparison below can tell 1.0
+        # from '1.0', so column dtypes are checked first
+        if not result_df.dtypes.equals(expected_df.dtypes):
+            print("FAIL: Parser test FAILED - output doesn't match expected CSV")
+            for col in expected_df.columns:
+                if result_df[col].dtype != expected_df[col].dtype:
+                    print(f"  {col}: expected dtype {expected_df[col].dtype}, got {result_df[col].dtype}")
+            return False
+        
+        # Fast path: the parser's CSV serialization (as _save_results writes
+        # it) is byte-identical to the expected file when the output matches
+        result_csv = result_df.to_csv(index=False, lineterminator='\n')
+        result_digest = hashlib.blake2b(result_csv.encode(), digest_size=16).digest()
+        if result_digest == file_digest(expected_path):
+            print("PASS: Parser test PASSED - output matches expected CSV")
+            print(f"Successfully parsed {len(result_df)} transactions")
+            return True
         
         # Compare DataFrames
         result_df = result_df.reset_index(drop=True)
@@ -29,16 +191,21 @@ def test_parser():
         result_df = result_df.fillna('')
         expected_df = expected_df.fillna('')
         
-        # Check if DataFrames are equal
-        are_equal = result_df.equals(expected_df)
+        # Check if DataFrames are equal: columns are mixed dtype after
+        # fillna(''), so compare both as string arrays in one vectorized pass
+        a = result_df.to_numpy(copy=False).astype(str, copy=False)
+        b = expected_df.to_numpy(copy=False).astype(str, copy=False)
         
-        if are_equal:
+        if np.array_equal(a, b):
             print("PASS: Parser test PASSED - output matches expected CSV")
             print(f"Successfully parsed {len(result_df)} transactions")
             return True
         else:
             print("FAIL: Parser test FAILED - output doesn't match expected CSV")
-            print(f"Expected shape: {expected_df.shape}, Got shape: {result_df.shape}")
+            rows, cols = np.where(a != b)
+            print(f"{len(rows)} mismatched cells, first few:")
+            for row, col in list(zip(rows, cols))[:5]:
+                print(f"  row {row}, {expected_df.columns[col]}: expected '{b[row, col]}', got '{a[row, col]}'")
             return False
             
     except Exception as e: